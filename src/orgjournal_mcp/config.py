@@ -13,6 +13,12 @@ DEFAULT_JOURNAL_DIR = Path(
 )
 DEFAULT_LAST_DAYS = 7
 
+# 未キャッシュのファイルのパース方式 ("serial"、"thread" または "process")
+PARALLEL_MODE = os.getenv("ORGJOURNAL_PARALLEL", "serial")
+MAX_WORKERS = 8
+# 未キャッシュのファイルがこれより少ない場合はプールを作らず逐次処理する
+PARALLEL_MIN_FILES = 4
+
 # ジャーナルファイル名パターン
 JOURNAL_FILE_PATTERN = "journal-{year_month}.org"
 
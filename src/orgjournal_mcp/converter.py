@@ -1,32 +1,136 @@
 """ジャーナル変換ロジックモジュール"""
 
+import heapq
+import os
 import re
-from datetime import datetime, timedelta
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from itertools import chain
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from orgparse import load
-
-from .config import DEFAULT_JOURNAL_DIR, DEFAULT_LAST_DAYS
+from orgparse.date import OrgDate
+
+from .config import (
+    DEFAULT_JOURNAL_DIR,
+    DEFAULT_LAST_DAYS,
+    MAX_WORKERS,
+    PARALLEL_MIN_FILES,
+    PARALLEL_MODE,
+)
+
+# パース結果のキャッシュ: (パス, mtime_ns, サイズ) -> (エントリーのリスト, タグの転置インデックス)
+_PARSE_CACHE: OrderedDict[
+    tuple[str, int, int], tuple[List["Entry"], Dict[str, List[int]]]
+] = OrderedDict()
+_PARSE_CACHE_MAXSIZE = 64
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# ディレクトリ内のジャーナルファイル一覧のキャッシュ: ディレクトリ -> (mtime_ns, [(年月, パス)])
+_DIR_CACHE: Dict[Path, tuple[int, List[tuple[str, Path]]]] = {}
+_JOURNAL_FILE_RE = re.compile(r'^journal-(\d{4}-\d{2})\.org$')
+
+# 見出し処理用の正規表現
+_TS_RE = re.compile(r'\[[\d\-]+ \w+ [\d:]+\]\s*')
+# 末尾のタグブロック全体（:tag1:tag2:）
+_TAG_RE = re.compile(r'\s*:([^:\s]+(?::[^:\s]+)*):\s*$')
+# タイトル（タイムスタンプを含む）とタグを一度に取り出す
+_HEADING_RE = re.compile(r'^(.*?)(?:\s*:([^:\s]+(?::[^:\s]+)*):)?$')
+
+# 高速パース用の正規表現
+_NODE_HEADER_RE = re.compile(r'^\*+ ', re.M)
+# 曜日名（datetime.weekday() の順）
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+# タグを連結して検索するときの区切り文字
+_TAG_SEP = '\0'
+# orgparse による解釈が必要な要素（リンク、TODO キーワード、優先度、SCHEDULED 等）
+_FAST_PATH_UNSUPPORTED_RE = re.compile(
+    r'\[\['
+    r'|^\s*#\+(?i:(?:SEQ_|TYP_)?TODO):'
+    r'|^\*+\s+(?:(?:TODO|DONE)(?:\s|$)|\[#)'
+    r'|(?:SCHEDULED|DEADLINE|CLOSED|CLOCK):'
+    r'|:PROPERTIES:'
+    r'|-\s+State\s+"',
+    re.M
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Entry:
+    """ジャーナルエントリー
+
+    検索・フィルタリング用の派生フィールド（datetime、小文字化したテキスト、タグ集合）は
+    生成時に一度だけ計算する。MCP クライアントには to_dict() で公開用のフィールドのみ返す。
+    パース結果のキャッシュで共有されるため変更不可とし、タグはタプルで保持する。
+    """
+    date: str
+    day_of_week: str
+    timestamp: str
+    title: str
+    body: str
+    tags: tuple[str, ...]
+    # 日付の比較・並べ替えに使う datetime（省略時は timestamp から求める）
+    ts: Optional[datetime] = field(default=None, repr=False, compare=False)
+    title_lower: str = field(init=False, repr=False, compare=False)
+    body_lower: str = field(init=False, repr=False, compare=False)
+    # 小文字化したタグを区切り文字で連結した文字列
+    tags_lower: str = field(init=False, repr=False, compare=False)
+    tagset: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # frozen のため、派生フィールドは object.__setattr__ で設定する
+        set_field = object.__setattr__
+        tags = tuple(self.tags)
+        title_lower = self.title.lower()
+        body_lower = self.body.lower()
+        tags_lower = _TAG_SEP.join(tags).lower()
+        set_field(self, 'tags', tags)
+        if self.ts is None:
+            set_field(self, 'ts', datetime.fromisoformat(self.timestamp))
+        set_field(self, 'title_lower', title_lower)
+        set_field(self, 'body_lower', body_lower)
+        set_field(self, 'tags_lower', tags_lower)
+        set_field(self, 'tagset', frozenset(tags))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """MCP クライアントに返す辞書に変換"""
+        return {
+            "date": self.date,
+            "day_of_week": self.day_of_week,
+            "timestamp": self.timestamp,
+            "title": self.title,
+            "body": self.body,
+            "tags": list(self.tags)
+        }
 
 
 def remove_timestamp(heading: str) -> str:
     """見出しからタイムスタンプを除去"""
-    return re.sub(r'\[[\d\-]+ \w+ [\d:]+\]\s*', '', heading)
+    return _TS_RE.sub('', heading)
+
+
+def split_heading(heading: str) -> tuple[str, List[str]]:
+    """見出しをタグを除いた部分とタグのリストに分ける"""
+    tag_match = _TAG_RE.search(heading)
+    if tag_match:
+        return heading[:tag_match.start()], tag_match.group(1).split(':')
+    return heading, []
 
 
 def extract_tags(heading: str) -> List[str]:
     """見出しからタグを抽出"""
-    tag_match = re.search(r':([^:]+):$', heading)
-    if tag_match:
-        tags = tag_match.group(1).split(':')
-        return [tag for tag in tags if tag]
-    return []
+    return split_heading(heading)[1]
 
 
 def remove_tags(heading: str) -> str:
     """見出しからタグを除去"""
-    return re.sub(r'\s*:[^:]+:$', '', heading)
+    return split_heading(heading)[0]
 
 
 def get_date_range(
@@ -35,12 +139,16 @@ def get_date_range(
     before: Optional[datetime] = None
 ) -> tuple[datetime, datetime]:
     """フィルタリング条件から実際の日付範囲を計算"""
-    now = datetime.now()
+    # since と before のみが指定された場合は現在時刻を取得せずにそのまま返す
+    if last_days is None and since is not None and before is not None:
+        return since, before
 
     # デフォルトは直近7日間
     if last_days is None and since is None and before is None:
         last_days = DEFAULT_LAST_DAYS
 
+    now = datetime.now()
+
     # 開始日の決定
     if last_days is not None:
         start_date = now - timedelta(days=last_days)
@@ -59,179 +167,458 @@ def get_date_range(
     return start_date, end_date
 
 
+def _list_journal_files(journal_dir: Path) -> List[tuple[str, Path]]:
+    """ディレクトリ内のジャーナルファイルを年月順に返す
+
+    一覧はディレクトリの mtime をキーにキャッシュし、
+    ファイルの追加・削除があった場合のみ再スキャンする。
+    """
+    try:
+        dir_mtime = journal_dir.stat().st_mtime_ns
+    except OSError:
+        return []
+
+    cached = _DIR_CACHE.get(journal_dir)
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1]
+
+    journal_files = []
+    try:
+        with os.scandir(journal_dir) as it:
+            for dir_entry in it:
+                match = _JOURNAL_FILE_RE.match(dir_entry.name)
+                if match and dir_entry.is_file():
+                    journal_files.append((match.group(1), Path(dir_entry.path)))
+    except OSError:
+        return []
+    journal_files.sort()
+
+    _DIR_CACHE[journal_dir] = (dir_mtime, journal_files)
+    return journal_files
+
+
 def get_required_journal_files(
     journal_dir: Path,
     start_date: datetime,
     end_date: datetime
 ) -> List[Path]:
     """日付範囲に必要なジャーナルファイルのリストを取得"""
-    required_files = []
-
-    # 月ごとにループ
-    current = start_date.replace(day=1)
-    end = end_date.replace(day=1)
-
-    while current <= end:
-        year_month = current.strftime('%Y-%m')
-        filename = f"journal-{year_month}.org"
-        filepath = journal_dir / filename
+    journal_files = _list_journal_files(journal_dir)
 
-        if filepath.exists():
-            required_files.append(filepath)
+    # 年月順に並んでいるので、範囲の両端を二分探索で求める
+    start = bisect_left(journal_files, start_date.strftime('%Y-%m'), key=itemgetter(0))
+    end = bisect_right(journal_files, end_date.strftime('%Y-%m'), key=itemgetter(0))
 
-        # 次の月へ
-        if current.month == 12:
-            current = current.replace(year=current.year + 1, month=1)
-        else:
-            current = current.replace(month=current.month + 1)
-
-    return required_files
+    return [filepath for _, filepath in journal_files[start:end]]
 
 
 def filter_entries_by_date(
-    entries: List[Dict[str, Any]],
+    entries: List[Entry],
     last_days: Optional[int] = None,
     since: Optional[datetime] = None,
     before: Optional[datetime] = None
-) -> List[Dict[str, Any]]:
+) -> List[Entry]:
     """日付範囲でエントリーをフィルタリング"""
     if not entries:
         return entries
 
-    filtered = entries
-
-    # 直近n日間でフィルタリング
+    # 下限と上限を一度だけ計算し、1回の走査で判定する
+    start = None
     if last_days is not None:
-        cutoff_date = datetime.now() - timedelta(days=last_days)
-        filtered = [e for e in filtered if datetime.fromisoformat(e['timestamp']) >= cutoff_date]
-
-    # 指定日以降でフィルタリング
+        start = datetime.now() - timedelta(days=last_days)
     if since is not None:
-        filtered = [e for e in filtered if datetime.fromisoformat(e['timestamp']) >= since]
+        start = since if start is None else max(start, since)
+    end = before
 
-    # 指定日より前でフィルタリング
-    if before is not None:
-        filtered = [e for e in filtered if datetime.fromisoformat(e['timestamp']) < before]
+    if start is None and end is None:
+        return entries
 
-    return filtered
+    # 事前計算した datetime で比較する（タイムスタンプ文字列はパースしない）
+    return [
+        e for e in entries
+        if (start is None or e.ts >= start) and (end is None or e.ts < end)
+    ]
+
+
+def _make_entry(
+    timestamp: datetime | date,
+    title: str,
+    tags: List[str] | tuple[str, ...],
+    body: str
+) -> Entry:
+    """エントリーを作成"""
+    # strftime は遅いため、日付は ISO 形式の先頭から、曜日は weekday() から求める
+    iso = timestamp.isoformat()
+    return Entry(
+        date=iso[:10],
+        day_of_week=_DAY_NAMES[timestamp.weekday()],
+        timestamp=iso,
+        title=title,
+        body=body,
+        tags=tags,
+        # 日付のみのタイムスタンプは 0 時とみなす
+        ts=timestamp if isinstance(timestamp, datetime) else datetime.combine(timestamp, time())
+    )
+
+
+def to_public_entries(entries: List[Entry]) -> List[Dict[str, Any]]:
+    """エントリーを MCP クライアントに返す辞書のリストに変換"""
+    return [entry.to_dict() for entry in entries]
+
+
+def _parse_heading(heading: str) -> tuple[str, List[str]]:
+    """見出しからタイトル（タイムスタンプ・タグを除去）とタグを取り出す"""
+    heading_match = _HEADING_RE.match(heading)
+    # 見出しの途中にあるものも含めて、全てのタイムスタンプを除去する
+    title = _TS_RE.sub('', heading_match.group(1)).strip()
+    tags = heading_match.group(2).split(':') if heading_match.group(2) else []
+    return title, tags
+
+
+def _first_timestamp(heading: str, body: str) -> Optional[datetime]:
+    """見出し・本文の順に探して最初のタイムスタンプ（範囲を除く）を返す"""
+    for line in chain((heading,), body.split('\n')):
+        for org_date in OrgDate.list_from_str(line):
+            if not org_date.has_end():
+                return org_date.start
+    return None
+
+
+def _scan_org_file(org_file_path: Path) -> Optional[List[Entry]]:
+    """レベル4の見出しを正規表現で走査してエントリーのリストを返す
+
+    orgparse で木構造を構築せずに必要な部分だけを取り出す高速な経路。
+    orgparse による解釈が必要な要素を含むファイルの場合は None を返す。
+    """
+    text = org_file_path.read_text(encoding='utf-8')
+    if _FAST_PATH_UNSUPPORTED_RE.search(text):
+        return None
 
+    headers = list(_NODE_HEADER_RE.finditer(text))
+    entries = []
 
-def process_org_file(org_file_path: Path) -> List[Dict[str, Any]]:
-    """単一のOrg-modeファイルを処理してエントリーのリストを返す"""
-    try:
-        root = load(str(org_file_path))
-        entries = []
-
-        for node in root[1:]:
-            if node.level == 4:
-                # タイムスタンプの取得
-                if node.datelist and len(node.datelist) > 0:
-                    timestamp = node.datelist[0].start
-                else:
-                    continue  # タイムスタンプがない場合はスキップ
-
-                # 見出しの処理
-                heading = remove_timestamp(node.heading)
-                tags = extract_tags(heading)
-                title = remove_tags(heading).strip()
-
-                # 本文の処理
-                body = node.body.strip() if node.body else ""
-
-                # 日付と曜日の取得
-                date_str = timestamp.strftime('%Y-%m-%d')
-                day_of_week = timestamp.strftime('%A')
-                timestamp_str = timestamp.isoformat()
-
-                entry = {
-                    "date": date_str,
-                    "day_of_week": day_of_week,
-                    "timestamp": timestamp_str,
-                    "title": title,
-                    "body": body,
-                    "tags": tags
-                }
-
-                entries.append(entry)
+    for i, header in enumerate(headers):
+        # レベル4の見出しのみ対象（"**** " の5文字）
+        if header.end() - header.start() != 5:
+            continue
 
-        return entries
+        node_end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        heading, _, body = text[header.end():node_end].partition('\n')
+        heading = heading.strip()
+
+        # タイムスタンプがない場合はスキップ
+        timestamp = _first_timestamp(heading, body)
+        if timestamp is None:
+            continue
+
+        title, tags = _parse_heading(heading)
+        entries.append(_make_entry(timestamp, title, tags, body.strip()))
+
+    return entries
+
+
+def _load_org_file(org_file_path: Path) -> List[Entry]:
+    """orgparse で単一のOrg-modeファイルをパースしてエントリーのリストを返す"""
+    root = load(str(org_file_path))
+    entries = []
+
+    for node in root[1:]:
+        if node.level == 4:
+            # タイムスタンプの取得
+            datelist = node.datelist
+            if datelist:
+                timestamp = datelist[0].start
+            else:
+                continue  # タイムスタンプがない場合はスキップ
+
+            # 見出しの処理
+            # orgparse は見出しからタグを除去するため、タグは元の見出し行から取得する
+            title, _ = _parse_heading(node.heading)
+            _, tags = _parse_heading(str(node).partition('\n')[0].strip())
+
+            # 本文の処理
+            body = node.body
+            body = body.strip() if body else ""
+
+            entries.append(_make_entry(timestamp, title, tags, body))
+
+    return entries
+
+
+def _parse_org_file(org_file_path: Path) -> List[Entry]:
+    """単一のOrg-modeファイルをパースしてエントリーのリストを返す"""
+    entries = _scan_org_file(org_file_path)
+    if entries is None:
+        entries = _load_org_file(org_file_path)
+
+    # 日付範囲を二分探索で切り出せるようにタイムスタンプ順に並べておく
+    entries.sort(key=attrgetter('ts'))
+    return entries
+
+
+def _build_tag_index(entries: List[Entry]) -> Dict[str, List[int]]:
+    """タグ -> そのタグを持つエントリーの位置（昇順）の転置インデックスを作成"""
+    tag_index: Dict[str, List[int]] = defaultdict(list)
+    for i, entry in enumerate(entries):
+        for tag in entry.tagset:
+            tag_index[tag].append(i)
+    return dict(tag_index)
+
+
+def _select_by_tags(
+    entries: List[Entry],
+    tag_index: Dict[str, List[int]],
+    lo: int,
+    hi: int,
+    include_tags: Optional[List[str]],
+    exclude_tags: Optional[List[str]]
+) -> List[Entry]:
+    """転置インデックスを使って entries[lo:hi] をタグで絞り込む
+
+    条件は filter_entries_by_tags と同じ（exclude_tags が優先）。
+    """
+    def positions(tags: List[str]) -> set[int]:
+        # 各タグの位置のリストから [lo, hi) の範囲を二分探索で切り出す
+        found = set()
+        for tag in tags:
+            postings = tag_index.get(tag, [])
+            found.update(postings[bisect_left(postings, lo):bisect_left(postings, hi)])
+        return found
 
+    selected = positions(include_tags) if include_tags is not None else set(range(lo, hi))
+    if exclude_tags:
+        selected -= positions(exclude_tags)
+
+    return [entries[i] for i in sorted(selected)]
+
+
+def _cache_key(org_file_path: Path) -> tuple[str, int, int]:
+    """パース結果のキャッシュのキー (パス, mtime_ns, サイズ) を返す"""
+    st = org_file_path.stat()
+    return (str(org_file_path), st.st_mtime_ns, st.st_size)
+
+
+def _cache_get(
+    key: tuple[str, int, int]
+) -> Optional[tuple[List[Entry], Dict[str, List[int]]]]:
+    """キャッシュからパース結果を取り出す（ない場合は None）"""
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            _PARSE_CACHE.move_to_end(key)
+    return cached
+
+
+def _cache_put(
+    key: tuple[str, int, int],
+    entries: List[Entry]
+) -> tuple[List[Entry], Dict[str, List[int]]]:
+    """パース結果とタグの転置インデックスをキャッシュに格納する"""
+    cached = (entries, _build_tag_index(entries))
+
+    with _PARSE_CACHE_LOCK:
+        # 同じパスの古いキャッシュを破棄
+        for stale_key in [k for k in _PARSE_CACHE if k[0] == key[0]]:
+            del _PARSE_CACHE[stale_key]
+
+        _PARSE_CACHE[key] = cached
+        if len(_PARSE_CACHE) > _PARSE_CACHE_MAXSIZE:
+            _PARSE_CACHE.popitem(last=False)
+
+    return cached
+
+
+def _try_parse_org_file(org_file_path: Path) -> Optional[List[Entry]]:
+    """ファイルをパースする（エラーの場合は None を返す）"""
+    try:
+        return _parse_org_file(org_file_path)
     except Exception as e:
-        # エラーは無視して空のリストを返す
+        return None
+
+
+def _select_entries(
+    cached: tuple[List[Entry], Dict[str, List[int]]],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    include_tags: Optional[List[str]],
+    exclude_tags: Optional[List[str]]
+) -> List[Entry]:
+    """パース結果から日付範囲・タグの条件に合うエントリーを切り出す"""
+    entries, tag_index = cached
+
+    # 範囲外のエントリーはここで除外し、後段のソート・フィルタリングに渡さない
+    # （エントリーはタイムスタンプ順なので、範囲の両端を二分探索で求める）
+    lo = 0
+    hi = len(entries)
+    if start_date is not None:
+        lo = bisect_left(entries, start_date, key=attrgetter('ts'))
+    if end_date is not None:
+        hi = bisect_left(entries, end_date, lo=lo, key=attrgetter('ts'))
+
+    if include_tags is not None or exclude_tags:
+        return _select_by_tags(entries, tag_index, lo, hi, include_tags, exclude_tags)
+    return entries[lo:hi]
+
+
+def process_org_file(
+    org_file_path: Path,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    include_tags: Optional[List[str]] = None,
+    exclude_tags: Optional[List[str]] = None
+) -> List[Entry]:
+    """単一のOrg-modeファイルを処理してエントリーのリストを返す
+
+    パース結果とタグの転置インデックスは (パス, mtime, サイズ) をキーにキャッシュし、
+    ファイルが変更されていなければ再パースしない。
+    start_date / end_date を指定した場合は start_date <= timestamp < end_date
+    のエントリーのみを返す。include_tags / exclude_tags を指定した場合は
+    filter_entries_by_tags と同じ条件でタグによる絞り込みも行う。
+    """
+    try:
+        key = _cache_key(org_file_path)
+    except OSError:
         return []
 
+    cached = _cache_get(key)
+    if cached is None:
+        entries = _try_parse_org_file(org_file_path)
+        if entries is None:
+            # エラーは無視して空のリストを返す
+            return []
+        cached = _cache_put(key, entries)
+
+    return _select_entries(cached, start_date, end_date, include_tags, exclude_tags)
+
+
+def process_org_files(
+    org_file_paths: List[Path],
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    include_tags: Optional[List[str]] = None,
+    exclude_tags: Optional[List[str]] = None
+) -> List[List[Entry]]:
+    """複数のOrg-modeファイルを処理してファイルごとのエントリーのリストを返す
+
+    キャッシュ済みのファイルは逐次処理し、未キャッシュのファイルのみをパースする。
+    ORGJOURNAL_PARALLEL が thread / process で、未キャッシュのファイルが
+    PARALLEL_MIN_FILES 以上ある場合のみ、そのパースをプールで並列に行う。
+    パース結果は呼び出し元のプロセスでキャッシュに格納する。
+    """
+    results: List[List[Entry]] = []
+    # 未キャッシュのファイル: (結果の位置, キャッシュのキー, パス)
+    misses: List[tuple[int, tuple[str, int, int], Path]] = []
+
+    for path in org_file_paths:
+        try:
+            key = _cache_key(path)
+        except OSError:
+            results.append([])
+            continue
+
+        cached = _cache_get(key)
+        if cached is None:
+            misses.append((len(results), key, path))
+            results.append([])
+        else:
+            results.append(
+                _select_entries(cached, start_date, end_date, include_tags, exclude_tags)
+            )
+
+    if not misses:
+        return results
+
+    miss_paths = [path for _, _, path in misses]
+    if PARALLEL_MODE in ("thread", "process") and len(misses) >= PARALLEL_MIN_FILES:
+        executor_class = ProcessPoolExecutor if PARALLEL_MODE == "process" else ThreadPoolExecutor
+        with executor_class(max_workers=min(MAX_WORKERS, len(misses))) as executor:
+            parsed = list(executor.map(_try_parse_org_file, miss_paths))
+    else:
+        parsed = [_try_parse_org_file(path) for path in miss_paths]
+
+    for (i, key, _), entries in zip(misses, parsed):
+        # パースに失敗したファイルは空のリストのままにする
+        if entries is not None:
+            results[i] = _select_entries(
+                _cache_put(key, entries), start_date, end_date, include_tags, exclude_tags
+            )
+
+    return results
+
 
 def convert_to_json_schema(
     journal_dir: Optional[Path] = None,
     last_days: Optional[int] = None,
     since: Optional[datetime] = None,
-    before: Optional[datetime] = None
+    before: Optional[datetime] = None,
+    include_tags: Optional[List[str]] = None,
+    exclude_tags: Optional[List[str]] = None
 ) -> Dict[str, Any]:
-    """ジャーナルディレクトリからJSONスキーマに変換"""
+    """ジャーナルディレクトリからJSONスキーマに変換
+
+    include_tags / exclude_tags を指定した場合は、ファイルごとにキャッシュした
+    タグの転置インデックスで絞り込む（filter_entries_by_tags と同じ条件）。
+    """
     if journal_dir is None:
         journal_dir = DEFAULT_JOURNAL_DIR
 
     # 日付範囲を計算
     start_date, end_date = get_date_range(last_days, since, before)
 
+    # last_days と since が両方指定された場合は遅い方を下限とする
+    if last_days is not None and since is not None:
+        start_date = max(start_date, since)
+
     # 必要なファイルを取得
     required_files = get_required_journal_files(journal_dir, start_date, end_date)
 
-    all_entries = []
-
-    for file_path in required_files:
-        entries = process_org_file(file_path)
-        all_entries.extend(entries)
-
-    # タイムスタンプでソート
-    all_entries.sort(key=lambda x: x['timestamp'])
+    # 日付範囲・タグでのフィルタリングはファイルごとに行う
+    # （before 未指定時は未来の日付のエントリーも含めるため、上限は before のみ）
+    per_file_entries = process_org_files(
+        required_files, start_date, before, include_tags, exclude_tags
+    )
 
-    # 日付範囲でフィルタリング
-    filtered_entries = filter_entries_by_date(all_entries, last_days, since, before)
+    # ファイルごとの結果はタイムスタンプ順なので、全体をソートせずにマージする
+    # （1ファイルのみの場合は、結合のためのコピーを作らずにそのまま使う）
+    if len(per_file_entries) == 1:
+        all_entries = per_file_entries[0]
+    else:
+        all_entries = list(heapq.merge(*per_file_entries, key=attrgetter('ts')))
 
-    return {"entries": filtered_entries}
+    return {"entries": all_entries}
 
 
 def search_entries(
-    entries: List[Dict[str, Any]],
+    entries: List[Entry],
     query: str,
     search_in_body: bool = True,
     search_in_title: bool = True,
     search_in_tags: bool = True
-) -> List[Dict[str, Any]]:
+) -> List[Entry]:
     """エントリーをキーワード検索"""
     if not query:
         return entries
 
     query_lower = query.lower()
-    results = []
-
-    for entry in entries:
-        matched = False
-
-        if search_in_title and query_lower in entry['title'].lower():
-            matched = True
-
-        if search_in_body and query_lower in entry['body'].lower():
-            matched = True
 
-        if search_in_tags:
-            for tag in entry['tags']:
-                if query_lower in tag.lower():
-                    matched = True
-                    break
+    # 区切り文字を含むクエリはどのタグにも一致しない
+    search_in_tags = search_in_tags and _TAG_SEP not in query_lower
 
-        if matched:
-            results.append(entry)
-
-    return results
+    # 事前計算済みの小文字化フィールドに対して、短いタグ → タイトル → 長い本文の順に検索し、
+    # 一致した時点で残りのフィールドの検索を省く
+    return [
+        entry for entry in entries
+        if (search_in_tags and query_lower in entry.tags_lower)
+        or (search_in_title and query_lower in entry.title_lower)
+        or (search_in_body and query_lower in entry.body_lower)
+    ]
 
 
 def filter_entries_by_tags(
-    entries: List[Dict[str, Any]],
+    entries: List[Entry],
     include_tags: Optional[List[str]] = None,
     exclude_tags: Optional[List[str]] = None
-) -> List[Dict[str, Any]]:
+) -> List[Entry]:
     """エントリーをタグでフィルタリング
 
     Args:
@@ -245,24 +632,47 @@ def filter_entries_by_tags(
     if not entries:
         return entries
 
+    # タグの判定は Python レベルのループではなく集合演算（C 実装）で行う
+    include_set = frozenset(include_tags) if include_tags is not None else None
+    exclude_set = frozenset(exclude_tags) if exclude_tags else None
+
     results = []
 
     for entry in entries:
-        entry_tags = entry.get('tags', [])
+        # 事前計算したタグ集合を使う
+        entry_tags = entry.tagset
 
         # exclude_tags のチェック（優先）
-        if exclude_tags:
+        if exclude_set is not None:
             # 除外タグが1つでも含まれている場合はスキップ
-            if any(tag in exclude_tags for tag in entry_tags):
+            if not exclude_set.isdisjoint(entry_tags):
                 continue
 
         # include_tags のチェック
-        if include_tags is not None:
+        if include_set is not None:
             # 含めるタグが1つでも含まれている場合のみ追加
-            if any(tag in include_tags for tag in entry_tags):
+            if not include_set.isdisjoint(entry_tags):
                 results.append(entry)
         else:
             # include_tags が指定されていない場合は、除外されなかったエントリーを全て追加
             results.append(entry)
 
     return results
+
+
+__all__ = [
+    "Entry",
+    "remove_timestamp",
+    "extract_tags",
+    "remove_tags",
+    "split_heading",
+    "get_date_range",
+    "get_required_journal_files",
+    "filter_entries_by_date",
+    "to_public_entries",
+    "process_org_file",
+    "process_org_files",
+    "convert_to_json_schema",
+    "search_entries",
+    "filter_entries_by_tags",
+]
@@ -1,18 +1,29 @@
 """FastMCP サーバー実装"""
 
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
-from .converter import convert_to_json_schema, search_entries, filter_entries_by_tags
+from .converter import (
+    convert_to_json_schema,
+    search_entries,
+    to_public_entries,
+)
 from .config import DEFAULT_JOURNAL_DIR, DEFAULT_LAST_DAYS
 
 # FastMCP サーバーインスタンスを作成
 mcp = FastMCP("orgjournal-mcp")
 
 
+@lru_cache(maxsize=32)
+def _to_path(journal_dir: Optional[str]) -> Path:
+    """ジャーナルディレクトリの文字列をパスに変換（未指定の場合はデフォルト）"""
+    return Path(journal_dir) if journal_dir else DEFAULT_JOURNAL_DIR
+
+
 @mcp.tool()
 def get_journal_entries(
     last_days: Optional[int] = None,
@@ -42,7 +53,7 @@ def get_journal_entries(
     before_dt = datetime.fromisoformat(before) if before else None
 
     # ジャーナルディレクトリ
-    journal_path = Path(journal_dir) if journal_dir else DEFAULT_JOURNAL_DIR
+    journal_path = _to_path(journal_dir)
 
     # エントリーを取得
     result = convert_to_json_schema(
@@ -53,7 +64,7 @@ def get_journal_entries(
     )
 
     return {
-        "entries": result["entries"],
+        "entries": to_public_entries(result["entries"]),
         "count": len(result["entries"]),
         "period": {
             "last_days": last_days,
@@ -99,7 +110,7 @@ def search_journal(
     before_dt = datetime.fromisoformat(before) if before else None
 
     # ジャーナルディレクトリ
-    journal_path = Path(journal_dir) if journal_dir else DEFAULT_JOURNAL_DIR
+    journal_path = _to_path(journal_dir)
 
     # まずエントリーを取得
     result = convert_to_json_schema(
@@ -119,7 +130,7 @@ def search_journal(
     )
 
     return {
-        "entries": search_results,
+        "entries": to_public_entries(search_results),
         "count": len(search_results),
         "query": query,
         "search_options": {
@@ -151,23 +162,19 @@ def get_recent_entries(
         - get_recent_entries(days=30)  # Last 30 days, excluding "chore" tag
     """
     # ジャーナルディレクトリ
-    journal_path = Path(journal_dir) if journal_dir else DEFAULT_JOURNAL_DIR
+    journal_path = _to_path(journal_dir)
 
     # エントリーを取得
+    # "chore" タグを除外
     result = convert_to_json_schema(
         journal_dir=journal_path,
-        last_days=days
-    )
-
-    # "chore" タグを除外
-    filtered_entries = filter_entries_by_tags(
-        entries=result["entries"],
-        include_tags=None,
+        last_days=days,
         exclude_tags=["chore"]
     )
+    filtered_entries = result["entries"]
 
     return {
-        "entries": filtered_entries,
+        "entries": to_public_entries(filtered_entries),
         "count": len(filtered_entries),
         "days": days
     }
@@ -207,25 +214,21 @@ def get_entries_by_tag(
     before_dt = datetime.fromisoformat(before) if before else None
 
     # ジャーナルディレクトリ
-    journal_path = Path(journal_dir) if journal_dir else DEFAULT_JOURNAL_DIR
+    journal_path = _to_path(journal_dir)
 
-    # エントリーを取得
+    # エントリーを取得（タグでのフィルタリングはタグの転置インデックスで行う）
     result = convert_to_json_schema(
         journal_dir=journal_path,
         last_days=last_days,
         since=since_dt,
-        before=before_dt
-    )
-
-    # タグでフィルタリング
-    filtered_entries = filter_entries_by_tags(
-        entries=result["entries"],
+        before=before_dt,
         include_tags=tags,
         exclude_tags=exclude_tags
     )
+    filtered_entries = result["entries"]
 
     return {
-        "entries": filtered_entries,
+        "entries": to_public_entries(filtered_entries),
         "count": len(filtered_entries),
         "filter": {
             "include_tags": tags,
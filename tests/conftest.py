@@ -4,23 +4,27 @@
 
 from pathlib import Path
 from datetime import datetime
+import shutil
 import pytest
-from typing import Dict, List
+from typing import Any, Dict, List
 
+from orgjournal_mcp.converter import Entry, process_org_files
+from orgjournal_mcp.server import get_journal_entries
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """テストフィクスチャディレクトリのパスを返す"""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_journal_2025_01(fixtures_dir: Path) -> Path:
     """2025年1月のサンプルジャーナルファイルパス"""
     return fixtures_dir / "sample_journal_2025-01.org"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_journal_2024_12(fixtures_dir: Path) -> Path:
     """2024年12月のサンプルジャーナルファイルパス"""
     return fixtures_dir / "sample_journal_2024-12.org"
@@ -32,10 +36,52 @@ def empty_journal(fixtures_dir: Path) -> Path:
     return fixtures_dir / "empty_journal.org"
 
 
+@pytest.fixture(scope="session")
+def sample_journal_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+    sample_journal_2024_12: Path,
+    sample_journal_2025_01: Path
+) -> Path:
+    """journal-YYYY-MM.org 形式のファイル名でサンプルを配置したジャーナルディレクトリ
+
+    テストセッション全体で共有するため、テスト内で変更しないこと。
+    """
+    journal_dir = tmp_path_factory.mktemp("journal")
+    shutil.copy(sample_journal_2024_12, journal_dir / "journal-2024-12.org")
+    shutil.copy(sample_journal_2025_01, journal_dir / "journal-2025-01.org")
+    return journal_dir
+
+
+@pytest.fixture(scope="session")
+def parsed_fixtures(sample_journal_2024_12: Path, sample_journal_2025_01: Path) -> List[Entry]:
+    """サンプルジャーナルをパースした全エントリー（タイムスタンプ順）
+
+    テストセッション全体で共有するため、テスト内で変更しないこと。
+    """
+    return [
+        entry
+        for entries in process_org_files([sample_journal_2024_12, sample_journal_2025_01])
+        for entry in entries
+    ]
+
+
+@pytest.fixture(scope="session")
+def all_sample_entries(sample_journal_dir: Path) -> Dict[str, Any]:
+    """サンプルジャーナル全期間の get_journal_entries の結果
+
+    テストセッション全体で共有するため、テスト内で変更しないこと。
+    """
+    return get_journal_entries(
+        since="2024-12-01",
+        before="2025-02-01",
+        journal_dir=str(sample_journal_dir)
+    )
+
+
 @pytest.fixture
-def sample_entries_data() -> List[Dict]:
+def sample_entries_data() -> List[Entry]:
     """テスト用のサンプルエントリーデータ"""
-    return [
+    return [Entry(**data) for data in [
         {
             "date": "2025-01-04",
             "day_of_week": "Saturday",
@@ -68,4 +114,4 @@ def sample_entries_data() -> List[Dict]:
             "body": "Some personal thoughts about the project.",
             "tags": []
         }
-    ]
+    ]]
@@ -9,6 +9,8 @@ from orgjournal_mcp.config import (
     DEFAULT_JOURNAL_DIR,
     DEFAULT_LAST_DAYS,
     JOURNAL_FILE_PATTERN,
+    PARALLEL_MIN_FILES,
+    PARALLEL_MODE,
     get_journal_dir,
 )
 
@@ -35,6 +37,14 @@ class TestConfigConstants:
         assert JOURNAL_FILE_PATTERN == "journal-{year_month}.org"
         assert isinstance(JOURNAL_FILE_PATTERN, str)
 
+    def test_parallel_mode(self):
+        """並列処理方式のデフォルト値確認"""
+        assert PARALLEL_MODE == "serial"
+
+    def test_parallel_min_files(self):
+        """並列処理を行う最小ファイル数の確認"""
+        assert PARALLEL_MIN_FILES == 4
+
 
 class TestGetJournalDir:
     """get_journal_dir() 関数のテスト"""
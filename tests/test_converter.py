@@ -2,24 +2,61 @@
 converter.py のテスト
 """
 
+import os
+import shutil
+import dataclasses
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Optional
 
 from orgjournal_mcp.converter import (
     remove_timestamp,
     extract_tags,
     remove_tags,
+    split_heading,
     get_date_range,
+    get_required_journal_files,
     filter_entries_by_date,
     process_org_file,
+    process_org_files,
     convert_to_json_schema,
     search_entries,
     filter_entries_by_tags,
+    to_public_entries,
+    Entry,
+    _scan_org_file,
+    _load_org_file,
 )
 
 
+def make_entry(
+    timestamp: str,
+    title: str,
+    tags: Optional[List[str]] = None,
+    body: str = ""
+) -> Entry:
+    """タイムスタンプとタイトルからテスト用のエントリーを作成"""
+    ts = datetime.fromisoformat(timestamp)
+    return Entry(
+        date=ts.strftime('%Y-%m-%d'),
+        day_of_week=ts.strftime('%A'),
+        timestamp=timestamp,
+        title=title,
+        body=body,
+        tags=tuple(tags or ())
+    )
+
+
+def assert_in_range(entries: List[Entry], since: datetime, before: datetime) -> None:
+    """エントリーがタイムスタンプ順に並び、すべて since <= ts < before であることを確認"""
+    timestamps = [entry.ts for entry in entries]
+    assert timestamps == sorted(timestamps)
+    if timestamps:
+        assert since <= timestamps[0]
+        assert timestamps[-1] < before
+
+
 class TestRemoveTimestamp:
     """タイムスタンプ削除のテスト"""
 
@@ -55,10 +92,8 @@ class TestExtractTags:
         """複数タグの抽出"""
         heading = "Project Meeting :meeting:work:urgent:"
         result = extract_tags(heading)
-        # 現在の実装では :meeting:work:urgent: 全体を抽出して split する
-        # 実際に抽出されるタグを確認
-        assert isinstance(result, list)
-        assert len(result) >= 1  # 少なくとも1つのタグが抽出される
+        # 末尾の :meeting:work:urgent: 全体を抽出して split する
+        assert result == ["meeting", "work", "urgent"]
 
     def test_no_tags(self):
         """タグなしの場合"""
@@ -87,10 +122,7 @@ class TestRemoveTags:
         heading = "Project Meeting :meeting:work:urgent:"
         result = remove_tags(heading)
         # remove_tags は末尾の :xxx: ブロック全体を削除
-        # 正規表現 \s*:[^:]+:$ にマッチするのは最後の :urgent: のみ
-        # 実際の動作を確認
-        assert "Project Meeting" in result
-        assert not result.endswith(":")
+        assert result == "Project Meeting"
 
     def test_no_tags_to_remove(self):
         """タグがない場合"""
@@ -99,6 +131,27 @@ class TestRemoveTags:
         assert result == "Simple Entry"
 
 
+class TestSplitHeading:
+    """見出しの分割のテスト"""
+
+    def test_split_with_tags(self):
+        """タグ付きの見出し"""
+        heading = "[2025-01-04 Sat 09:00] Project Meeting :meeting:work:"
+        assert split_heading(heading) == (
+            "[2025-01-04 Sat 09:00] Project Meeting", ["meeting", "work"]
+        )
+
+    def test_split_without_tags(self):
+        """タグなしの見出し"""
+        assert split_heading("Simple Entry") == ("Simple Entry", [])
+
+    def test_split_not_tag_block(self):
+        """末尾のタグブロックでないコロンはそのまま"""
+        assert split_heading("Ratio 1:2") == ("Ratio 1:2", [])
+        assert split_heading("Entry ::") == ("Entry ::", [])
+        assert split_heading("Entry :b:c: ") == ("Entry", ["b", "c"])
+
+
 class TestGetDateRange:
     """日付範囲計算のテスト"""
 
@@ -131,27 +184,91 @@ class TestGetDateRange:
         assert start == since_date
         assert end == before_date
 
+    def test_since_and_before_without_now(self, monkeypatch):
+        """since と before のみが指定された場合は現在時刻を取得しない"""
+        from orgjournal_mcp import converter
+
+        class NoNowDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                raise AssertionError("datetime.now() should not be called")
+
+        monkeypatch.setattr(converter, "datetime", NoNowDatetime)
+        since_date = datetime(2025, 1, 1)
+        before_date = datetime(2025, 2, 1)
+        assert get_date_range(since=since_date, before=before_date) == (since_date, before_date)
+
+
+class TestGetRequiredJournalFiles:
+    """必要なジャーナルファイル取得のテスト"""
+
+    @pytest.fixture
+    def journal_dir(self, tmp_path: Path) -> Path:
+        """月別ジャーナルファイルを含むディレクトリ"""
+        for year_month in ["2024-11", "2024-12", "2025-01", "2025-03"]:
+            (tmp_path / f"journal-{year_month}.org").write_text("")
+        (tmp_path / "notes.org").write_text("")
+        return tmp_path
+
+    def test_files_in_range(self, journal_dir: Path):
+        """範囲内の月のファイルのみを年月順に返す"""
+        files = get_required_journal_files(
+            journal_dir, datetime(2024, 12, 15), datetime(2025, 3, 1)
+        )
+        assert [f.name for f in files] == [
+            "journal-2024-12.org",
+            "journal-2025-01.org",
+            "journal-2025-03.org",
+        ]
+
+    def test_no_files_in_range(self, journal_dir: Path):
+        """範囲内にファイルがない場合"""
+        files = get_required_journal_files(
+            journal_dir, datetime(2023, 1, 1), datetime(2023, 12, 31)
+        )
+        assert files == []
+
+    def test_new_file_detected(self, journal_dir: Path):
+        """ファイルが追加された場合は一覧を更新する"""
+        start, end = datetime(2025, 1, 1), datetime(2025, 2, 28)
+        assert len(get_required_journal_files(journal_dir, start, end)) == 1
+
+        (journal_dir / "journal-2025-02.org").write_text("")
+        # ディレクトリの mtime を確実に変更する
+        stat = journal_dir.stat()
+        os.utime(journal_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        files = get_required_journal_files(journal_dir, start, end)
+        assert [f.name for f in files] == ["journal-2025-01.org", "journal-2025-02.org"]
+
+    def test_nonexistent_dir(self):
+        """存在しないディレクトリ"""
+        files = get_required_journal_files(
+            Path("/nonexistent/dir"), datetime(2025, 1, 1), datetime(2025, 2, 1)
+        )
+        assert files == []
+
 
 class TestFilterEntriesByDate:
     """日付フィルタリングのテスト"""
 
     @pytest.fixture
-    def sample_entries(self) -> List[Dict[str, Any]]:
+    def sample_entries(self) -> List[Entry]:
         """テスト用のエントリー"""
         now = datetime.now()
         return [
-            {"timestamp": (now - timedelta(days=1)).isoformat(), "title": "Yesterday"},
-            {"timestamp": (now - timedelta(days=3)).isoformat(), "title": "3 days ago"},
-            {"timestamp": (now - timedelta(days=7)).isoformat(), "title": "7 days ago"},
-            {"timestamp": (now - timedelta(days=10)).isoformat(), "title": "10 days ago"},
+            make_entry((now - timedelta(days=1)).isoformat(), "Yesterday"),
+            make_entry((now - timedelta(days=3)).isoformat(), "3 days ago"),
+            make_entry((now - timedelta(days=7)).isoformat(), "7 days ago"),
+            make_entry((now - timedelta(days=10)).isoformat(), "10 days ago"),
         ]
 
     def test_filter_by_last_days(self, sample_entries):
         """last_days でのフィルタリング"""
         filtered = filter_entries_by_date(sample_entries, last_days=5)
         assert len(filtered) == 2  # 1日前と3日前のみ
-        assert filtered[0]["title"] == "Yesterday"
-        assert filtered[1]["title"] == "3 days ago"
+        assert filtered[0].title == "Yesterday"
+        assert filtered[1].title == "3 days ago"
 
     def test_filter_by_since(self, sample_entries):
         """since でのフィルタリング"""
@@ -165,6 +282,44 @@ class TestFilterEntriesByDate:
         filtered = filter_entries_by_date(sample_entries, before=before_date)
         assert len(filtered) == 2  # 7日前と10日前のみ
 
+    def test_filter_boundaries(self):
+        """since は境界を含み、before は境界を含まない"""
+        entries = [
+            make_entry("2025-01-03T10:00:00", "Start"),
+            make_entry("2025-01-04T09:30:00", "Middle"),
+            make_entry("2025-01-05T00:00:00", "End"),
+        ]
+        filtered = filter_entries_by_date(
+            entries,
+            since=datetime(2025, 1, 3, 10, 0),
+            before=datetime(2025, 1, 5)
+        )
+        assert [e.title for e in filtered] == ["Start", "Middle"]
+
+    def test_filter_date_only_timestamp(self):
+        """日付のみのタイムスタンプはその日の 0 時として比較する"""
+        entries = [make_entry("2025-01-03", "Date Only")]
+        filtered = filter_entries_by_date(entries, since=datetime(2025, 1, 3))
+        # 文字列として比較すると "2025-01-03" < "2025-01-03T00:00:00" となり除外されてしまう
+        assert filtered == entries
+
+    def test_filter_parsed_entries(self, parsed_fixtures: List[Entry]):
+        """パース済みエントリー（datetime 事前計算済み）のフィルタリング"""
+        entries = parsed_fixtures
+        filtered = filter_entries_by_date(
+            entries,
+            since=datetime(2025, 1, 3),
+            before=datetime(2025, 1, 5)
+        )
+        assert [e.timestamp for e in filtered] == [
+            e.timestamp for e in entries
+            if "2025-01-03" <= e.timestamp < "2025-01-05"
+        ]
+
+    def test_no_filters(self, sample_entries):
+        """フィルター条件なしの場合はそのまま返す"""
+        assert filter_entries_by_date(sample_entries) is sample_entries
+
     def test_empty_entries(self):
         """空のエントリーリスト"""
         filtered = filter_entries_by_date([], last_days=7)
@@ -182,7 +337,7 @@ class TestProcessOrgFile:
         assert len(entries) > 0
 
         # 最初のエントリーの構造確認
-        first_entry = entries[0]
+        first_entry = entries[0].to_dict()
         assert "date" in first_entry
         assert "day_of_week" in first_entry
         assert "timestamp" in first_entry
@@ -190,6 +345,96 @@ class TestProcessOrgFile:
         assert "body" in first_entry
         assert "tags" in first_entry
 
+    def test_process_heading_title(self, sample_journal_2025_01: Path):
+        """見出しからタイムスタンプとタグが除去されたタイトル"""
+        entries = process_org_file(sample_journal_2025_01)
+        titles = [e.title for e in entries]
+        assert "New Year Planning" in titles
+        assert "Family Time" in titles
+        assert not any(title.startswith("[") for title in titles)
+
+    @pytest.mark.parametrize("extra", ["", "SCHEDULED: <2025-01-06 Mon>\n"])
+    def test_process_heading_inner_timestamps(self, tmp_path: Path, extra: str):
+        """見出しの先頭以外にあるタイムスタンプもタイトルから除去される"""
+        org_file = tmp_path / "journal-2025-01.org"
+        org_file.write_text(
+            "**** Meeting [2025-01-04 Sat 09:00] :work:\n"
+            + extra +
+            "**** [2025-01-05 Sun 09:00] Review [2025-01-05 Sun 10:00]\n"
+        )
+        entries = process_org_file(org_file)
+        assert [(e.title, list(e.tags)) for e in entries] == [
+            ("Meeting", ["work"]),
+            ("Review", []),
+        ]
+
+    def test_process_heading_tags(self, sample_journal_2025_01: Path):
+        """見出しのタグが抽出される"""
+        entries = process_org_file(sample_journal_2025_01)
+        by_title = {e.title: e for e in entries}
+        assert by_title["Work Kickoff Meeting"].tags == ("meeting", "work")
+        assert by_title["Family Time"].tags == ()
+
+    def test_process_orgparse_fallback(self, tmp_path: Path):
+        """orgparse による解釈が必要なファイルも同じ形式で処理する"""
+        org_file = tmp_path / "journal-2025-01.org"
+        org_file.write_text(
+            "*** 2025-01-04 Saturday\n"
+            "**** [2025-01-04 Sat 09:00] Project Meeting :meeting:work:\n"
+            "SCHEDULED: <2025-01-05 Sun>\n"
+            "See [[https://example.com][the notes]].\n"
+            "**** Entry Without Timestamp\n"
+            "No timestamp.\n"
+        )
+        entries = to_public_entries(process_org_file(org_file))
+
+        assert entries == [{
+            "date": "2025-01-04",
+            "day_of_week": "Saturday",
+            "timestamp": "2025-01-04T09:00:00",
+            "title": "Project Meeting",
+            "body": "See the notes.",
+            "tags": ["meeting", "work"],
+        }]
+
+    def test_fast_path_matches_orgparse(
+        self, sample_journal_2024_12: Path, sample_journal_2025_01: Path
+    ):
+        """高速な経路と orgparse による経路が同じエントリーを返す"""
+        for org_file in (sample_journal_2024_12, sample_journal_2025_01):
+            entries = _scan_org_file(org_file)
+            assert entries
+            assert entries == _load_org_file(org_file)
+
+    def test_orgparse_fallback_trailing_whitespace(self, tmp_path: Path):
+        """タグの後ろに空白がある見出しも orgparse による経路でタグを取り出す"""
+        org_file = tmp_path / "journal-2025-01.org"
+        org_file.write_text("**** [2025-01-04 Sat 09:00] X :a:b:   \nBody\n")
+        assert _scan_org_file(org_file) == _load_org_file(org_file)
+        assert _load_org_file(org_file)[0].tags == ("a", "b")
+
+    def test_process_entry_dates(self, tmp_path: Path):
+        """日付・曜日・タイムスタンプの形式（日付のみのタイムスタンプを含む）"""
+        org_file = tmp_path / "journal-2025-01.org"
+        org_file.write_text(
+            "**** [2025-01-05 Sun 23:59] Late Night\n"
+            "**** Date Only\n"
+            "<2025-01-06 Mon>\n"
+        )
+        entries = process_org_file(org_file)
+
+        assert [(e.date, e.day_of_week, e.timestamp) for e in entries] == [
+            ("2025-01-05", "Sunday", "2025-01-05T23:59:00"),
+            ("2025-01-06", "Monday", "2025-01-06"),
+        ]
+        assert entries[1].ts == datetime(2025, 1, 6)
+
+        # 日付のみのタイムスタンプはその日の 0 時として範囲判定する
+        entries = process_org_file(
+            org_file, start_date=datetime(2025, 1, 6), end_date=datetime(2025, 1, 7)
+        )
+        assert [e.title for e in entries] == ["Date Only"]
+
     def test_process_empty_journal(self, empty_journal: Path):
         """空のジャーナルファイルの処理"""
         entries = process_org_file(empty_journal)
@@ -200,10 +445,173 @@ class TestProcessOrgFile:
         entries = process_org_file(Path("/nonexistent/file.org"))
         assert entries == []
 
+    def test_process_with_date_range(self, sample_journal_2025_01: Path):
+        """日付範囲を指定した場合は範囲内のエントリーのみ返す"""
+        start_date = datetime(2025, 1, 3)
+        end_date = datetime(2025, 1, 5)
+        entries = process_org_file(sample_journal_2025_01, start_date, end_date)
+
+        assert len(entries) == 4
+        assert_in_range(entries, start_date, end_date)
+
+    def test_process_unordered_entries(self, tmp_path: Path):
+        """ファイル内で順不同のエントリーもタイムスタンプ順に範囲を切り出す"""
+        org_file = tmp_path / "journal-2025-01.org"
+        org_file.write_text(
+            "**** [2025-01-05 Sun 09:00] Third\n"
+            "**** [2025-01-03 Fri 09:00] First\n"
+            "**** [2025-01-04 Sat 09:00] Second\n"
+        )
+        entries = process_org_file(org_file)
+        assert [e.title for e in entries] == ["First", "Second", "Third"]
+
+        entries = process_org_file(org_file, datetime(2025, 1, 4), datetime(2025, 1, 5, 9, 0))
+        assert [e.title for e in entries] == ["Second"]
+
+    @pytest.mark.parametrize("include_tags, exclude_tags", [
+        (["work"], None),
+        (["work", "personal"], ["code"]),
+        (None, ["meeting"]),
+        (["work"], ["work"]),
+        ([], None),
+        (["nonexistent"], None),
+    ])
+    def test_process_with_tags(
+        self, sample_journal_2025_01: Path, include_tags, exclude_tags
+    ):
+        """タグを指定した場合は filter_entries_by_tags と同じ結果を返す"""
+        start_date = datetime(2025, 1, 2)
+        end_date = datetime(2025, 1, 5)
+        entries = process_org_file(
+            sample_journal_2025_01, start_date, end_date, include_tags, exclude_tags
+        )
+        assert entries == filter_entries_by_tags(
+            process_org_file(sample_journal_2025_01, start_date, end_date),
+            include_tags,
+            exclude_tags
+        )
+
+    def test_process_cached_result(self, sample_journal_2025_01: Path):
+        """変更のないファイルはキャッシュから同じ結果を返す"""
+        first = process_org_file(sample_journal_2025_01)
+        second = process_org_file(sample_journal_2025_01)
+        assert first == second
+        assert first is not second  # 呼び出し元の変更がキャッシュに影響しない
+
+    def test_process_modified_file(self, tmp_path: Path):
+        """ファイルが変更された場合は再パースする"""
+        org_file = tmp_path / "journal-2025-01.org"
+        org_file.write_text(
+            "*** 2025-01-04 Saturday\n"
+            "**** [2025-01-04 Sat 09:00] First\n"
+            "Body\n"
+        )
+        assert len(process_org_file(org_file)) == 1
+
+        org_file.write_text(
+            "*** 2025-01-04 Saturday\n"
+            "**** [2025-01-04 Sat 09:00] First\n"
+            "Body\n"
+            "**** [2025-01-04 Sat 10:00] Second\n"
+            "Body\n"
+        )
+        entries = process_org_file(org_file)
+        assert [e.title for e in entries] == ["First", "Second"]
+
+
+class TestProcessOrgFiles:
+    """複数 Org ファイルの処理のテスト"""
+
+    @pytest.fixture
+    def fresh_journals(
+        self, tmp_path: Path, sample_journal_2024_12: Path, sample_journal_2025_01: Path
+    ) -> List[Path]:
+        """キャッシュされていないジャーナルファイルのコピー"""
+        paths = []
+        for src in (sample_journal_2024_12, sample_journal_2025_01):
+            dst = tmp_path / src.name
+            shutil.copy(src, dst)
+            paths.append(dst)
+        return paths
+
+    @staticmethod
+    def fail_executor(*args, **kwargs):
+        raise AssertionError("executor should not be created")
+
+    @pytest.mark.parametrize("mode", ["serial", "thread", "process"])
+    def test_results_in_file_order(
+        self, monkeypatch, fresh_journals: List[Path], mode: str
+    ):
+        """どの方式でも結果はファイルの順序を保つ"""
+        from orgjournal_mcp import converter
+        monkeypatch.setattr(converter, "PARALLEL_MODE", mode)
+        monkeypatch.setattr(converter, "PARALLEL_MIN_FILES", 2)
+
+        results = process_org_files(fresh_journals)
+        assert results == [process_org_file(path) for path in fresh_journals]
+        assert all(results)
+
+    def test_serial_by_default(self, monkeypatch, fresh_journals: List[Path]):
+        """デフォルトではプールを作らずに逐次処理する"""
+        from orgjournal_mcp import converter
+        monkeypatch.setattr(converter, "PARALLEL_MIN_FILES", 2)
+        monkeypatch.setattr(converter, "ThreadPoolExecutor", self.fail_executor)
+        monkeypatch.setattr(converter, "ProcessPoolExecutor", self.fail_executor)
+
+        assert all(process_org_files(fresh_journals))
+
+    def test_serial_for_few_files(self, monkeypatch, fresh_journals: List[Path]):
+        """未キャッシュのファイル数が少ない場合はプールを作らない"""
+        from orgjournal_mcp import converter
+        monkeypatch.setattr(converter, "PARALLEL_MODE", "process")
+        monkeypatch.setattr(converter, "ThreadPoolExecutor", self.fail_executor)
+        monkeypatch.setattr(converter, "ProcessPoolExecutor", self.fail_executor)
+
+        assert all(process_org_files(fresh_journals))
+
+    def test_cached_files_skip_pool(self, monkeypatch, fresh_journals: List[Path]):
+        """キャッシュ済みのファイルのみの場合はプールを作らない"""
+        from orgjournal_mcp import converter
+        expected = [process_org_file(path) for path in fresh_journals]
+
+        monkeypatch.setattr(converter, "PARALLEL_MODE", "process")
+        monkeypatch.setattr(converter, "PARALLEL_MIN_FILES", 2)
+        monkeypatch.setattr(converter, "ThreadPoolExecutor", self.fail_executor)
+        monkeypatch.setattr(converter, "ProcessPoolExecutor", self.fail_executor)
+
+        assert process_org_files(fresh_journals) == expected
+
+    def test_missing_file(self, tmp_path: Path, sample_journal_2025_01: Path):
+        """存在しないファイルは空のリストになる"""
+        results = process_org_files([tmp_path / "journal-2000-01.org", sample_journal_2025_01])
+        assert results == [[], process_org_file(sample_journal_2025_01)]
+
+    def test_empty_file_list(self):
+        """空のファイルリスト"""
+        assert process_org_files([]) == []
+
 
 class TestConvertToJsonSchema:
     """JSON スキーマ変換のテスト"""
 
+    def test_convert_with_tags(self, sample_journal_dir: Path):
+        """タグを指定した変換"""
+        result = convert_to_json_schema(
+            journal_dir=sample_journal_dir,
+            since=datetime(2024, 12, 1),
+            include_tags=["work", "personal"],
+            exclude_tags=["meeting"]
+        )
+        all_entries = convert_to_json_schema(
+            journal_dir=sample_journal_dir,
+            since=datetime(2024, 12, 1)
+        )["entries"]
+
+        assert len(result["entries"]) > 0
+        assert result["entries"] == filter_entries_by_tags(
+            all_entries, include_tags=["work", "personal"], exclude_tags=["meeting"]
+        )
+
     def test_convert_with_fixtures(self, fixtures_dir: Path):
         """フィクスチャを使った変換テスト"""
         result = convert_to_json_schema(
@@ -214,28 +622,72 @@ class TestConvertToJsonSchema:
         assert "entries" in result
         assert isinstance(result["entries"], list)
 
-    def test_convert_with_date_filter(self, fixtures_dir: Path):
+    def test_convert_with_date_filter(self, sample_journal_dir: Path):
         """日付フィルタリング付きの変換"""
         since_date = datetime(2025, 1, 3)
         before_date = datetime(2025, 1, 5)
 
         result = convert_to_json_schema(
-            journal_dir=fixtures_dir,
+            journal_dir=sample_journal_dir,
             since=since_date,
             before=before_date
         )
 
         assert "entries" in result
+        assert len(result["entries"]) > 0
         # フィルタリングされたエントリーのみが含まれる
-        for entry in result["entries"]:
-            entry_date = datetime.fromisoformat(entry["timestamp"])
-            assert since_date <= entry_date < before_date
+        assert_in_range(result["entries"], since_date, before_date)
+
+    def test_convert_across_months(self, sample_journal_dir: Path):
+        """複数月のファイルにまたがる変換"""
+        result = convert_to_json_schema(
+            journal_dir=sample_journal_dir,
+            since=datetime(2024, 12, 30),
+            before=datetime(2025, 1, 3)
+        )
+
+        timestamps = [entry.timestamp for entry in result["entries"]]
+        assert timestamps == sorted(timestamps)
+        assert timestamps[0] >= "2024-12-30"
+        assert timestamps[-1] < "2025-01-03"
+        assert {entry.date[:7] for entry in result["entries"]} == {"2024-12", "2025-01"}
+
+    def test_convert_default_window(self, tmp_path: Path):
+        """日付の指定がない場合は直近7日間のエントリーのみを返す"""
+        now = datetime.now().replace(second=0, microsecond=0)
+        for days, title in [(10, "Old"), (3, "Recent")]:
+            ts = now - timedelta(days=days)
+            org_file = tmp_path / f"journal-{ts:%Y-%m}.org"
+            with org_file.open("a") as f:
+                f.write(f"**** [{ts:%Y-%m-%d %a %H:%M}] {title}\n")
+
+        result = convert_to_json_schema(journal_dir=tmp_path)
+        assert [e.title for e in result["entries"]] == ["Recent"]
+
+    def test_convert_overlapping_files(self, tmp_path: Path):
+        """ファイル間で日付が重なっていてもタイムスタンプ順に並ぶ"""
+        (tmp_path / "journal-2025-01.org").write_text(
+            "**** [2025-01-10 Fri 09:00] January\n"
+            "**** [2025-02-05 Wed 09:00] Late note\n"
+        )
+        (tmp_path / "journal-2025-02.org").write_text(
+            "**** [2025-02-01 Sat 09:00] February\n"
+            "**** [2025-02-10 Mon 09:00] Later February\n"
+        )
+        result = convert_to_json_schema(
+            journal_dir=tmp_path,
+            since=datetime(2025, 1, 1),
+            before=datetime(2025, 3, 1)
+        )
+        assert [e.title for e in result["entries"]] == [
+            "January", "February", "Late note", "Later February"
+        ]
 
 
 class TestSearchEntries:
     """キーワード検索のテスト"""
 
-    def test_search_in_title(self, sample_entries_data: List[Dict]):
+    def test_search_in_title(self, sample_entries_data: List[Entry]):
         """タイトル内検索"""
         results = search_entries(
             sample_entries_data,
@@ -245,9 +697,9 @@ class TestSearchEntries:
             search_in_tags=False
         )
         assert len(results) >= 1
-        assert any("meeting" in r["title"].lower() for r in results)
+        assert any("meeting" in r.title.lower() for r in results)
 
-    def test_search_in_body(self, sample_entries_data: List[Dict]):
+    def test_search_in_body(self, sample_entries_data: List[Entry]):
         """本文内検索"""
         results = search_entries(
             sample_entries_data,
@@ -258,7 +710,7 @@ class TestSearchEntries:
         )
         assert len(results) >= 1
 
-    def test_search_in_tags(self, sample_entries_data: List[Dict]):
+    def test_search_in_tags(self, sample_entries_data: List[Entry]):
         """タグ内検索"""
         results = search_entries(
             sample_entries_data,
@@ -268,9 +720,9 @@ class TestSearchEntries:
             search_in_tags=True
         )
         assert len(results) >= 1
-        assert any("work" in r["tags"] for r in results)
+        assert any("work" in r.tags for r in results)
 
-    def test_search_all_fields(self, sample_entries_data: List[Dict]):
+    def test_search_all_fields(self, sample_entries_data: List[Entry]):
         """全フィールド検索"""
         results = search_entries(
             sample_entries_data,
@@ -281,104 +733,159 @@ class TestSearchEntries:
         )
         assert len(results) >= 1
 
-    def test_search_case_insensitive(self, sample_entries_data: List[Dict]):
+    def test_search_case_insensitive(self, sample_entries_data: List[Entry]):
         """大文字小文字を区別しない検索"""
         results_lower = search_entries(sample_entries_data, "meeting")
         results_upper = search_entries(sample_entries_data, "MEETING")
         assert len(results_lower) == len(results_upper)
 
-    def test_search_empty_query(self, sample_entries_data: List[Dict]):
+    def test_search_empty_query(self, sample_entries_data: List[Entry]):
         """空のクエリ"""
         results = search_entries(sample_entries_data, "")
         assert results == sample_entries_data
 
-    def test_search_no_results(self, sample_entries_data: List[Dict]):
+    def test_search_special_characters(self, sample_entries_data: List[Entry]):
+        """正規表現の特殊文字を含むクエリ"""
+        results = search_entries(sample_entries_data, "TODAY'S")
+        assert [r.title for r in results] == ["Project Meeting"]
+        assert search_entries(sample_entries_data, "(.*)") == []
+
+    def test_search_parsed_entries(self, parsed_fixtures: List[Entry]):
+        """パース済みエントリー（小文字化フィールド事前計算済み）の検索"""
+        entries = parsed_fixtures
+        results = search_entries(entries, "KICKOFF", search_in_body=False, search_in_tags=False)
+        assert [r.title for r in results] == ["Work Kickoff Meeting"]
+
+        results = search_entries(entries, "WORK", search_in_title=False, search_in_body=False)
+        assert all("work" in r.tags for r in results)
+        assert len(results) >= 1
+
+    def test_search_body_only(self):
+        """本文のみの検索で、先頭・末尾のエントリーも一致する"""
+        entries = [
+            make_entry("2025-01-01T09:00:00", "First", body="alpha beta"),
+            make_entry("2025-01-02T09:00:00", "Second", body="gamma"),
+            make_entry("2025-01-03T09:00:00", "Third", body="beta beta"),
+        ]
+        results = search_entries(entries, "beta", search_in_title=False, search_in_tags=False)
+        assert [r.title for r in results] == ["First", "Third"]
+
+    def test_search_mixed_fields_keeps_order(self):
+        """異なるフィールドで一致したエントリーも元の順序で返す"""
+        entries = [
+            make_entry("2025-01-01T09:00:00", "Body", body="about python"),
+            make_entry("2025-01-02T09:00:00", "Python title", body="python again"),
+            make_entry("2025-01-03T09:00:00", "Other", body="nothing"),
+            make_entry("2025-01-04T09:00:00", "Tag", tags=["python"]),
+        ]
+        results = search_entries(entries, "Python")
+        assert [r.title for r in results] == ["Body", "Python title", "Tag"]
+
+    def test_search_tags_not_across_boundaries(self):
+        """連結したタグの境界をまたぐクエリは一致しない"""
+        entries = [make_entry("2025-01-01T09:00:00", "Entry", tags=["Work", "Meeting"])]
+        assert search_entries(entries, "MEETING", search_in_title=False, search_in_body=False) == entries
+        assert search_entries(entries, "workmeeting", search_in_title=False, search_in_body=False) == []
+        assert search_entries(entries, "work\0meeting", search_in_title=False, search_in_body=False) == []
+
+    def test_search_no_results(self, sample_entries_data: List[Entry]):
         """結果なしの検索"""
         results = search_entries(sample_entries_data, "nonexistent_keyword_xyz")
         assert results == []
 
 
+class TestEntry:
+    """エントリーのテスト"""
+
+    def test_immutable(self, sample_entries_data: List[Entry]):
+        """エントリーは変更できない"""
+        entry = sample_entries_data[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.title = "Changed"
+        assert isinstance(entry.tags, tuple)
+
+    def test_attribute_access_only(self, sample_entries_data: List[Entry]):
+        """フィールドは属性で参照し、辞書としては扱わない"""
+        entry = sample_entries_data[0]
+        assert entry.title == "Project Meeting"
+        assert entry.tags == ("meeting", "work")
+        with pytest.raises(TypeError):
+            entry["title"]
+        assert not hasattr(entry, "get")
+
+    def test_to_dict_tags_list(self, sample_entries_data: List[Entry]):
+        """公開用の辞書ではタグはリスト"""
+        assert sample_entries_data[0].to_dict()["tags"] == ["meeting", "work"]
+
+
+class TestToPublicEntries:
+    """公開用エントリー変換のテスト"""
+
+    def test_public_keys_only(self, parsed_fixtures: List[Entry]):
+        """公開用のキーのみを持つ辞書に変換される"""
+        entries = to_public_entries(parsed_fixtures)
+        assert len(entries) > 0
+        for entry in entries:
+            assert set(entry.keys()) == {"date", "day_of_week", "timestamp", "title", "body", "tags"}
+
+    def test_round_trip(self, sample_entries_data: List[Entry]):
+        """変換した辞書から同じエントリーを復元できる"""
+        entries = to_public_entries(sample_entries_data)
+        assert all(isinstance(entry, dict) for entry in entries)
+        assert [Entry(**entry) for entry in entries] == sample_entries_data
+
+
 class TestFilterEntriesByTags:
     """タグフィルタリングのテスト"""
 
     @pytest.fixture
-    def sample_tagged_entries(self) -> List[Dict]:
+    def sample_tagged_entries(self) -> List[Entry]:
         """タグ付きサンプルエントリー"""
         return [
-            {
-                "date": "2025-01-01",
-                "timestamp": "2025-01-01T09:00:00",
-                "title": "Work task",
-                "body": "Some work",
-                "tags": ["work"]
-            },
-            {
-                "date": "2025-01-02",
-                "timestamp": "2025-01-02T10:00:00",
-                "title": "Chore task",
-                "body": "Daily chore",
-                "tags": ["chore"]
-            },
-            {
-                "date": "2025-01-03",
-                "timestamp": "2025-01-03T11:00:00",
-                "title": "Meeting",
-                "body": "Team meeting",
-                "tags": ["work", "meeting"]
-            },
-            {
-                "date": "2025-01-04",
-                "timestamp": "2025-01-04T12:00:00",
-                "title": "Personal note",
-                "body": "Personal stuff",
-                "tags": ["personal"]
-            },
-            {
-                "date": "2025-01-05",
-                "timestamp": "2025-01-05T13:00:00",
-                "title": "Review task",
-                "body": "Code review",
-                "tags": ["work", "review"]
-            }
+            make_entry("2025-01-01T09:00:00", "Work task", ["work"], "Some work"),
+            make_entry("2025-01-02T10:00:00", "Chore task", ["chore"], "Daily chore"),
+            make_entry("2025-01-03T11:00:00", "Meeting", ["work", "meeting"], "Team meeting"),
+            make_entry("2025-01-04T12:00:00", "Personal note", ["personal"], "Personal stuff"),
+            make_entry("2025-01-05T13:00:00", "Review task", ["work", "review"], "Code review"),
         ]
 
-    def test_include_single_tag(self, sample_tagged_entries: List[Dict]):
+    def test_include_single_tag(self, sample_tagged_entries: List[Entry]):
         """単一タグでのフィルタリング（include）"""
         results = filter_entries_by_tags(
             sample_tagged_entries,
             include_tags=["work"]
         )
         assert len(results) == 3
-        assert all(any(tag == "work" for tag in r["tags"]) for r in results)
+        assert all(any(tag == "work" for tag in r.tags) for r in results)
 
-    def test_include_multiple_tags(self, sample_tagged_entries: List[Dict]):
+    def test_include_multiple_tags(self, sample_tagged_entries: List[Entry]):
         """複数タグでのフィルタリング（include）"""
         results = filter_entries_by_tags(
             sample_tagged_entries,
             include_tags=["work", "personal"]
         )
         assert len(results) == 4
-        assert all(any(tag in ["work", "personal"] for tag in r["tags"]) for r in results)
+        assert all(any(tag in ["work", "personal"] for tag in r.tags) for r in results)
 
-    def test_exclude_single_tag(self, sample_tagged_entries: List[Dict]):
+    def test_exclude_single_tag(self, sample_tagged_entries: List[Entry]):
         """単一タグの除外"""
         results = filter_entries_by_tags(
             sample_tagged_entries,
             exclude_tags=["chore"]
         )
         assert len(results) == 4
-        assert all("chore" not in r["tags"] for r in results)
+        assert all("chore" not in r.tags for r in results)
 
-    def test_exclude_multiple_tags(self, sample_tagged_entries: List[Dict]):
+    def test_exclude_multiple_tags(self, sample_tagged_entries: List[Entry]):
         """複数タグの除外"""
         results = filter_entries_by_tags(
             sample_tagged_entries,
             exclude_tags=["chore", "meeting"]
         )
         assert len(results) == 3
-        assert all("chore" not in r["tags"] and "meeting" not in r["tags"] for r in results)
+        assert all("chore" not in r.tags and "meeting" not in r.tags for r in results)
 
-    def test_include_and_exclude_combined(self, sample_tagged_entries: List[Dict]):
+    def test_include_and_exclude_combined(self, sample_tagged_entries: List[Entry]):
         """includeとexcludeの組み合わせ"""
         results = filter_entries_by_tags(
             sample_tagged_entries,
@@ -386,10 +893,10 @@ class TestFilterEntriesByTags:
             exclude_tags=["meeting"]
         )
         assert len(results) == 2
-        assert all(any(tag == "work" for tag in r["tags"]) for r in results)
-        assert all("meeting" not in r["tags"] for r in results)
+        assert all(any(tag == "work" for tag in r.tags) for r in results)
+        assert all("meeting" not in r.tags for r in results)
 
-    def test_no_filters(self, sample_tagged_entries: List[Dict]):
+    def test_no_filters(self, sample_tagged_entries: List[Entry]):
         """フィルターなし"""
         results = filter_entries_by_tags(
             sample_tagged_entries,
@@ -407,7 +914,7 @@ class TestFilterEntriesByTags:
         )
         assert results == []
 
-    def test_exclude_takes_priority(self, sample_tagged_entries: List[Dict]):
+    def test_exclude_takes_priority(self, sample_tagged_entries: List[Entry]):
         """excludeが優先されることを確認"""
         results = filter_entries_by_tags(
             sample_tagged_entries,
@@ -417,7 +924,18 @@ class TestFilterEntriesByTags:
         # "work" タグがexcludeされているので、結果は0件
         assert len(results) == 0
 
-    def test_empty_exclude_list(self, sample_tagged_entries: List[Dict]):
+    def test_parsed_entries(self, parsed_fixtures: List[Entry]):
+        """パース済みエントリー（タグ集合事前計算済み）のフィルタリング"""
+        entries = parsed_fixtures
+        results = filter_entries_by_tags(entries, include_tags=["work"], exclude_tags=["code"])
+
+        assert len(results) >= 1
+        assert all("work" in r.tags and "code" not in r.tags for r in results)
+        assert len(results) == sum(
+            1 for e in entries if "work" in e.tags and "code" not in e.tags
+        )
+
+    def test_empty_exclude_list(self, sample_tagged_entries: List[Entry]):
         """空のexcludeリスト（何も除外しない）"""
         results = filter_entries_by_tags(
             sample_tagged_entries,
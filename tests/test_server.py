@@ -4,9 +4,11 @@ server.py のテスト
 
 import pytest
 from pathlib import Path
-from datetime import datetime
+from typing import Dict, List
 
+from orgjournal_mcp.config import DEFAULT_JOURNAL_DIR
 from orgjournal_mcp.server import (
+    _to_path,
     get_journal_entries,
     search_journal,
     get_recent_entries,
@@ -14,6 +16,31 @@ from orgjournal_mcp.server import (
 )
 
 
+def assert_dates_in_range(entries: List[Dict], since_date: str, before_date: str) -> None:
+    """すべてのエントリーが since_date <= timestamp < before_date であることを確認
+
+    境界は日付のみ（YYYY-MM-DD）の文字列なので、ISO 8601 形式のタイムスタンプと
+    文字列のまま比較しても日時の比較と同じ結果になる。
+    """
+    for entry in entries:
+        assert since_date <= entry["timestamp"] < before_date
+
+
+class TestToPath:
+    """ジャーナルディレクトリのパス変換のテスト"""
+
+    def test_default_dir(self):
+        """未指定の場合はデフォルトディレクトリ"""
+        assert _to_path(None) == DEFAULT_JOURNAL_DIR
+        assert _to_path("") == DEFAULT_JOURNAL_DIR
+
+    def test_same_path_object(self, fixtures_dir: Path):
+        """同じ文字列には同じ Path オブジェクトを返す"""
+        path = _to_path(str(fixtures_dir))
+        assert path == fixtures_dir
+        assert _to_path(str(fixtures_dir)) is path
+
+
 class TestGetJournalEntries:
     """get_journal_entries ツールのテスト"""
 
@@ -30,12 +57,12 @@ class TestGetJournalEntries:
         assert isinstance(result["entries"], list)
         assert result["count"] == len(result["entries"])
 
-    def test_get_entries_with_date_range(self, fixtures_dir: Path):
+    def test_get_entries_with_date_range(self, sample_journal_dir: Path):
         """日付範囲指定でのエントリー取得"""
         result = get_journal_entries(
             since="2025-01-03",
             before="2025-01-05",
-            journal_dir=str(fixtures_dir)
+            journal_dir=str(sample_journal_dir)
         )
 
         assert "entries" in result
@@ -43,9 +70,8 @@ class TestGetJournalEntries:
         assert result["period"]["before"] == "2025-01-05"
 
         # フィルタリングされたエントリーの確認
-        for entry in result["entries"]:
-            entry_date = datetime.fromisoformat(entry["timestamp"])
-            assert datetime(2025, 1, 3) <= entry_date < datetime(2025, 1, 5)
+        assert result["count"] > 0
+        assert_dates_in_range(result["entries"], "2025-01-03", "2025-01-05")
 
     def test_get_entries_last_days(self, fixtures_dir: Path):
         """last_days パラメータでのエントリー取得"""
@@ -72,6 +98,18 @@ class TestGetJournalEntries:
         assert "since" in result["period"]
         assert "before" in result["period"]
 
+    def test_entry_structure(self, sample_journal_dir: Path):
+        """エントリーには公開用のキーのみが含まれる"""
+        result = get_journal_entries(
+            since="2024-12-01",
+            before="2025-02-01",
+            journal_dir=str(sample_journal_dir)
+        )
+
+        assert result["count"] > 0
+        for entry in result["entries"]:
+            assert set(entry.keys()) == {"date", "day_of_week", "timestamp", "title", "body", "tags"}
+
 
 class TestSearchJournal:
     """search_journal ツールのテスト"""
@@ -122,20 +160,19 @@ class TestSearchJournal:
         for entry in result["entries"]:
             assert "work" in entry["tags"]
 
-    def test_search_with_date_filter(self, fixtures_dir: Path):
+    def test_search_with_date_filter(self, sample_journal_dir: Path):
         """日付フィルタリング付きの検索"""
         result = search_journal(
             query="meeting",
             since="2025-01-01",
             before="2025-01-10",
-            journal_dir=str(fixtures_dir)
+            journal_dir=str(sample_journal_dir)
         )
 
         assert "entries" in result
         # 日付範囲内のエントリーのみが含まれていることを確認
-        for entry in result["entries"]:
-            entry_date = datetime.fromisoformat(entry["timestamp"])
-            assert datetime(2025, 1, 1) <= entry_date < datetime(2025, 1, 10)
+        assert result["count"] > 0
+        assert_dates_in_range(result["entries"], "2025-01-01", "2025-01-10")
 
     def test_search_no_results(self, fixtures_dir: Path):
         """結果なしの検索"""
@@ -302,20 +339,20 @@ class TestGetEntriesByTag:
         for entry in result["entries"]:
             assert "chore" not in entry["tags"]
 
-    def test_get_entries_with_date_range(self, fixtures_dir: Path):
+    def test_get_entries_with_date_range(self, sample_journal_dir: Path):
         """日付範囲指定付きのタグフィルタリング"""
         result = get_entries_by_tag(
             tags=["work"],
             since="2025-01-01",
             before="2025-01-10",
-            journal_dir=str(fixtures_dir)
+            journal_dir=str(sample_journal_dir)
         )
 
         assert "entries" in result
         # 日付範囲内のエントリーのみが含まれていることを確認
+        assert result["count"] > 0
+        assert_dates_in_range(result["entries"], "2025-01-01", "2025-01-10")
         for entry in result["entries"]:
-            entry_date = datetime.fromisoformat(entry["timestamp"])
-            assert datetime(2025, 1, 1) <= entry_date < datetime(2025, 1, 10)
             assert "work" in entry["tags"]
 
     def test_response_structure(self, fixtures_dir: Path):
@@ -359,34 +396,32 @@ class TestIntegration:
         # 同じエントリー数を返すはず
         assert entries_with_filter["count"] == recent_result["count"]
 
-    def test_search_subset_of_entries(self, fixtures_dir: Path):
+    def test_search_subset_of_entries(self, sample_journal_dir: Path, all_sample_entries: Dict):
         """検索結果は全エントリーのサブセット"""
-        all_entries = get_journal_entries(
-            last_days=365,
-            journal_dir=str(fixtures_dir)
-        )
+        all_entries = all_sample_entries
 
         search_result = search_journal(
             query="meeting",
-            last_days=365,
-            journal_dir=str(fixtures_dir)
+            since="2024-12-01",
+            before="2025-02-01",
+            journal_dir=str(sample_journal_dir)
         )
 
-        # 検索結果は全エントリー以下のはず
-        assert search_result["count"] <= all_entries["count"]
+        # 検索結果は全エントリーの一部のはず
+        assert 0 < search_result["count"] < all_entries["count"]
+        assert all(entry in all_entries["entries"] for entry in search_result["entries"])
 
-    def test_tag_filter_subset_of_entries(self, fixtures_dir: Path):
+    def test_tag_filter_subset_of_entries(self, sample_journal_dir: Path, all_sample_entries: Dict):
         """タグフィルター結果は全エントリーのサブセット"""
-        all_entries = get_journal_entries(
-            last_days=365,
-            journal_dir=str(fixtures_dir)
-        )
+        all_entries = all_sample_entries
 
         tag_result = get_entries_by_tag(
             tags=["work"],
-            last_days=365,
-            journal_dir=str(fixtures_dir)
+            since="2024-12-01",
+            before="2025-02-01",
+            journal_dir=str(sample_journal_dir)
         )
 
-        # タグフィルター結果は全エントリー以下のはず
-        assert tag_result["count"] <= all_entries["count"]
+        # タグフィルター結果は全エントリーの一部のはず
+        assert 0 < tag_result["count"] < all_entries["count"]
+        assert all(entry in all_entries["entries"] for entry in tag_result["entries"])